@@ -1 +1 @@
-from .igviz import plot
+from .igviz import invalidate_layout_cache, plot
@@ -0,0 +1,67 @@
+"""
+GPU ForceAtlas2 layout through RAPIDS cuGraph.
+
+Requires the optional `cugraph` and `cudf` dependencies, import this module lazily.
+"""
+
+import cudf
+import cugraph
+import networkx as nx
+import numpy as np
+
+# The cuGraph graph built for the last graph laid out, reused when it is laid out again
+_cugraph_cache: dict = {}
+
+
+def force_atlas2_layout(G: nx.Graph, max_iter: int = 500) -> dict:
+    """
+    Positions the nodes of `G` with cuGraph's GPU ForceAtlas2 implementation.
+
+    Nodes are renumbered to integers before being copied to the GPU, nodes without
+    edges are placed uniformly at random within the extent of the layout.
+
+    Parameters
+    ----------
+    G : Networkx Graph
+        Network Graph
+
+    max_iter : int, optional
+        Number of ForceAtlas2 iterations, by default 500
+
+    Returns
+    -------
+    dict
+        Positions keyed by node.
+    """
+
+    nodes = list(G.nodes())
+    key = (id(G), G.number_of_nodes(), G.number_of_edges(), hash(frozenset(G.edges())))
+
+    if key in _cugraph_cache:
+        cuG = _cugraph_cache[key]
+    else:
+        node_index = {node: i for i, node in enumerate(nodes)}
+        edges = np.array(
+            [(node_index[u], node_index[v]) for u, v in G.edges()], dtype=np.int64
+        ).reshape(-1, 2)
+
+        edf = cudf.DataFrame({"src": edges[:, 0], "dst": edges[:, 1]})
+        cuG = cugraph.Graph()
+        cuG.from_cudf_edgelist(edf, source="src", destination="dst")
+
+        # Only keep one graph on the GPU at a time
+        _cugraph_cache.clear()
+        _cugraph_cache[key] = cuG
+
+    pos_df = cugraph.force_atlas2(cuG, max_iter=max_iter).to_pandas()
+
+    pos = np.full((len(nodes), 2), np.nan)
+    pos[pos_df["vertex"].to_numpy()] = pos_df[["x", "y"]].to_numpy()
+
+    missing = np.isnan(pos[:, 0])
+    if missing.any():
+        low = np.nanmin(pos, axis=0) if not missing.all() else np.zeros(2)
+        high = np.nanmax(pos, axis=0) if not missing.all() else np.ones(2)
+        pos[missing] = np.random.uniform(low, high, size=(missing.sum(), 2))
+
+    return dict(zip(nodes, pos))
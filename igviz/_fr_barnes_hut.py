@@ -0,0 +1,269 @@
+"""
+Numba implementation of the Fruchterman-Reingold layout with Barnes-Hut repulsion.
+
+The repulsive forces are approximated with a quadtree, bringing each iteration from
+O(N^2) down to O(N log N). Requires the optional `numba` dependency, import this
+module lazily.
+"""
+
+from typing import Optional
+
+import networkx as nx
+import numba
+import numpy as np
+
+from ._fr_numba import csr_adjacency
+
+# Cells deeper than this are not split, coincident nodes are aggregated instead
+_MAX_DEPTH = 48
+
+
+@numba.njit(cache=True)
+def _quadrant(cx, cy, x, y):
+    return (1 if x >= cx else 0) + (2 if y >= cy else 0)
+
+
+@numba.njit(cache=True)
+def build_quadtree(pos):
+    """
+    Inserts every node into a quadtree.
+
+    The cells are stored as flat arrays, the four children of a cell are stored
+    contiguously starting at `first_child`, which is -1 for leaves.
+
+    Parameters
+    ----------
+    pos : np.ndarray
+        (N, 2) node positions.
+
+    Returns
+    -------
+    Tuple[np.ndarray, ...]
+        first_child, body, mass, centre of mass and half size of each cell.
+    """
+
+    n = pos.shape[0]
+    capacity = 4 * n + 1
+
+    first_child = np.full(capacity, -1, dtype=np.int64)
+    body = np.full(capacity, -1, dtype=np.int64)
+    mass = np.zeros(capacity)
+    com = np.zeros((capacity, 2))
+    centre = np.zeros((capacity, 2))
+    half = np.zeros(capacity)
+
+    low_x, high_x = pos[:, 0].min(), pos[:, 0].max()
+    low_y, high_y = pos[:, 1].min(), pos[:, 1].max()
+    centre[0, 0] = 0.5 * (low_x + high_x)
+    centre[0, 1] = 0.5 * (low_y + high_y)
+    half[0] = 0.5 * max(high_x - low_x, high_y - low_y) + 1e-9
+    count = 1
+
+    for i in range(n):
+        x, y = pos[i, 0], pos[i, 1]
+        node = 0
+        depth = 0
+
+        while True:
+            mass[node] += 1.0
+            com[node, 0] += x
+            com[node, 1] += y
+
+            if first_child[node] == -1:
+                if body[node] == -1:
+                    body[node] = i
+                    break
+
+                if depth >= _MAX_DEPTH:
+                    break
+
+                if count + 4 > capacity:
+                    capacity *= 2
+                    first_child = np.concatenate(
+                        (first_child, np.full(capacity - first_child.size, -1))
+                    )
+                    body = np.concatenate((body, np.full(capacity - body.size, -1)))
+                    mass = np.concatenate((mass, np.zeros(capacity - mass.size)))
+                    com = np.concatenate((com, np.zeros((capacity - com.shape[0], 2))))
+                    centre = np.concatenate(
+                        (centre, np.zeros((capacity - centre.shape[0], 2)))
+                    )
+                    half = np.concatenate((half, np.zeros(capacity - half.size)))
+
+                first_child[node] = count
+                quarter = 0.5 * half[node]
+                for q in range(4):
+                    child = count + q
+                    half[child] = quarter
+                    centre[child, 0] = centre[node, 0] + (
+                        quarter if q & 1 else -quarter
+                    )
+                    centre[child, 1] = centre[node, 1] + (
+                        quarter if q & 2 else -quarter
+                    )
+                count += 4
+
+                # Push the node that occupied the leaf down one level
+                j = body[node]
+                body[node] = -1
+                child = first_child[node] + _quadrant(
+                    centre[node, 0], centre[node, 1], pos[j, 0], pos[j, 1]
+                )
+                mass[child] = 1.0
+                com[child, 0] = pos[j, 0]
+                com[child, 1] = pos[j, 1]
+                body[child] = j
+
+            node = first_child[node] + _quadrant(centre[node, 0], centre[node, 1], x, y)
+            depth += 1
+
+    for c in range(count):
+        if mass[c] > 0:
+            com[c, 0] /= mass[c]
+            com[c, 1] /= mass[c]
+
+    return first_child[:count], body[:count], mass[:count], com[:count], half[:count]
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def fr_barnes_hut_layout(indptr, indices, pos, iterations, k, theta):
+    """
+    Runs the Fruchterman-Reingold iterations in place on `pos`, approximating the
+    repulsion of a cell by its centre of mass when its size over its distance is
+    below `theta`.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        CSR row pointers of the symmetric adjacency matrix.
+
+    indices : np.ndarray
+        CSR column indices of the symmetric adjacency matrix.
+
+    pos : np.ndarray
+        (N, 2) initial positions, updated in place.
+
+    iterations : int
+        Number of iterations to run.
+
+    k : float
+        Optimal distance between nodes.
+
+    theta : float
+        Barnes-Hut opening criterion.
+
+    Returns
+    -------
+    np.ndarray
+        The updated positions.
+    """
+
+    n = pos.shape[0]
+    k2 = k * k
+    theta2 = theta * theta
+    t = 0.1
+    dt = t / (iterations + 1)
+    disp = np.zeros((n, 2))
+
+    for _ in range(iterations):
+        first_child, body, mass, com, half = build_quadtree(pos)
+
+        # Each node only writes its own displacement, so the nodes run in parallel
+        for i in numba.prange(n):
+            x, y = pos[i, 0], pos[i, 1]
+            fx = 0.0
+            fy = 0.0
+
+            stack = np.empty(3 * _MAX_DEPTH + 4, dtype=np.int64)
+            stack[0] = 0
+            top = 1
+
+            while top > 0:
+                top -= 1
+                c = stack[top]
+
+                if mass[c] == 0.0 or (body[c] == i and mass[c] == 1.0):
+                    continue
+
+                dx = x - com[c, 0]
+                dy = y - com[c, 1]
+                d2 = dx * dx + dy * dy
+
+                size = 2.0 * half[c]
+                if first_child[c] == -1 or size * size < theta2 * d2:
+                    if d2 > 1e-12:
+                        f = mass[c] * k2 / d2
+                        fx += dx * f
+                        fy += dy * f
+                else:
+                    for q in range(4):
+                        stack[top] = first_child[c] + q
+                        top += 1
+
+            for e in range(indptr[i], indptr[i + 1]):
+                j = indices[e]
+                dx = x - pos[j, 0]
+                dy = y - pos[j, 1]
+                f = np.sqrt(dx * dx + dy * dy) / k
+                fx -= dx * f
+                fy -= dy * f
+
+            disp[i, 0] = fx
+            disp[i, 1] = fy
+
+        for i in numba.prange(n):
+            length = np.sqrt(disp[i, 0] * disp[i, 0] + disp[i, 1] * disp[i, 1])
+            if length > 0.0:
+                step = min(length, t) / length
+                pos[i, 0] += disp[i, 0] * step
+                pos[i, 1] += disp[i, 1] * step
+
+        t -= dt
+
+    return pos
+
+
+def spring_layout(
+    G: nx.Graph, iterations: int = 50, theta: float = 0.9, seed: Optional[int] = None
+) -> dict:
+    """
+    Positions the nodes of `G` using the Fruchterman-Reingold force-directed algorithm
+    with Barnes-Hut approximated repulsion.
+
+    Mirrors `nx.spring_layout`, the positions are rescaled to [-1, 1].
+
+    Parameters
+    ----------
+    G : Networkx Graph
+        Network Graph
+
+    iterations : int, optional
+        Number of iterations, by default 50
+
+    theta : float, optional
+        Barnes-Hut opening criterion, larger is faster and less accurate, by default 0.9
+
+    seed : int, optional
+        Seed for the initial random positions, by default None
+
+    Returns
+    -------
+    dict
+        Positions keyed by node.
+    """
+
+    nodes = list(G.nodes())
+    n_nodes = len(nodes)
+
+    if n_nodes == 0:
+        return {}
+
+    indptr, indices = csr_adjacency(G, nodes)
+
+    pos = np.random.default_rng(seed).random((n_nodes, 2))
+    pos = fr_barnes_hut_layout(
+        indptr, indices, pos, iterations, np.sqrt(1.0 / n_nodes), theta
+    )
+    pos = nx.rescale_layout(pos)
+
+    return dict(zip(nodes, pos))
@@ -0,0 +1,158 @@
+"""
+Numba implementation of the Fruchterman-Reingold force-directed layout.
+
+Requires the optional `numba` dependency, import this module lazily.
+"""
+
+from typing import Optional
+
+import networkx as nx
+import numba
+import numpy as np
+
+
+@numba.njit(fastmath=True, cache=True)
+def fr_layout(indptr, indices, pos, iterations, k):
+    """
+    Runs the Fruchterman-Reingold iterations in place on `pos`.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        CSR row pointers of the symmetric adjacency matrix.
+
+    indices : np.ndarray
+        CSR column indices of the symmetric adjacency matrix.
+
+    pos : np.ndarray
+        (N, 2) initial positions, updated in place.
+
+    iterations : int
+        Number of iterations to run.
+
+    k : float
+        Optimal distance between nodes.
+
+    Returns
+    -------
+    np.ndarray
+        The updated positions.
+    """
+
+    n = pos.shape[0]
+    k2 = k * k
+    t = 0.1
+    dt = t / (iterations + 1)
+    disp = np.zeros((n, 2))
+
+    for _ in range(iterations):
+        disp[:] = 0.0
+
+        # Repulsion between every pair, applied to both nodes at once. The force
+        # k^2 / d along the unit vector dx / d is k^2 * dx / d^2, so no sqrt is needed.
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                f = k2 / (dx * dx + dy * dy + 1e-9)
+                disp[i, 0] += dx * f
+                disp[i, 1] += dy * f
+                disp[j, 0] -= dx * f
+                disp[j, 1] -= dy * f
+
+        # Attraction along the edges, each undirected edge is stored in both rows.
+        for i in range(n):
+            for e in range(indptr[i], indptr[i + 1]):
+                j = indices[e]
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                f = np.sqrt(dx * dx + dy * dy) / k
+                disp[i, 0] -= dx * f
+                disp[i, 1] -= dy * f
+
+        # Move each node at most the current temperature, then cool down linearly.
+        for i in range(n):
+            length = np.sqrt(disp[i, 0] * disp[i, 0] + disp[i, 1] * disp[i, 1])
+            if length > 0.0:
+                step = min(length, t) / length
+                pos[i, 0] += disp[i, 0] * step
+                pos[i, 1] += disp[i, 1] * step
+
+        t -= dt
+
+    return pos
+
+
+def csr_adjacency(G: nx.Graph, nodes: list):
+    """
+    Builds the symmetric adjacency of `G` in CSR form, ignoring self loops.
+
+    Parameters
+    ----------
+    G : Networkx Graph
+        Network Graph
+
+    nodes : list
+        Order of the nodes, row i corresponds to nodes[i].
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Row pointers and column indices.
+    """
+
+    n_nodes = len(nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array(
+        [(node_index[u], node_index[v]) for u, v in G.edges() if u != v],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    # Each edge is stored in both rows, parallel edges pull proportionally harder
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    indices = cols[np.argsort(rows, kind="stable")]
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_nodes), out=indptr[1:])
+
+    return indptr, indices
+
+
+def spring_layout(
+    G: nx.Graph, iterations: int = 50, seed: Optional[int] = None
+) -> dict:
+    """
+    Positions the nodes of `G` using the Fruchterman-Reingold force-directed algorithm.
+
+    Mirrors `nx.spring_layout`, the positions are rescaled to [-1, 1].
+
+    Parameters
+    ----------
+    G : Networkx Graph
+        Network Graph
+
+    iterations : int, optional
+        Number of iterations, by default 50
+
+    seed : int, optional
+        Seed for the initial random positions, by default None
+
+    Returns
+    -------
+    dict
+        Positions keyed by node.
+    """
+
+    nodes = list(G.nodes())
+    n_nodes = len(nodes)
+
+    if n_nodes == 0:
+        return {}
+
+    indptr, indices = csr_adjacency(G, nodes)
+
+    pos = np.random.default_rng(seed).random((n_nodes, 2))
+    pos = fr_layout(indptr, indices, pos, iterations, np.sqrt(1.0 / n_nodes))
+    pos = nx.rescale_layout(pos)
+
+    return dict(zip(nodes, pos))
@@ -0,0 +1,94 @@
+"""
+Force-directed layout found by minimising a spring energy with SciPy's L-BFGS-B.
+"""
+
+from typing import Optional
+
+import networkx as nx
+import numpy as np
+
+
+def spring_lbfgs_layout(
+    G: nx.Graph, maxiter: int = 200, seed: Optional[int] = None
+) -> dict:
+    """
+    Positions the nodes of `G` by minimising the energy
+
+        sum_{(i, j) in E} ||x_i - x_j||^2 - k^2 sum_{i < j} log (||x_i - x_j|| / c)
+
+    with L-BFGS-B, which converges in far fewer steps than the Fruchterman-Reingold
+    iterations of `nx.spring_layout`. The repulsion is only computed between pairs
+    closer than the cutoff c = 10 * k, found with a KD-tree, and is 0 past it. This
+    bounds the energy, so disconnected components settle a cutoff apart instead of
+    drifting apart without limit.
+
+    The positions are rescaled to [-1, 1].
+
+    Parameters
+    ----------
+    G : Networkx Graph
+        Network Graph
+
+    maxiter : int, optional
+        Maximum number of L-BFGS-B iterations, by default 200
+
+    seed : int, optional
+        Seed for the initial random positions, by default None
+
+    Returns
+    -------
+    dict
+        Positions keyed by node.
+    """
+
+    from scipy.optimize import minimize
+    from scipy.spatial import cKDTree
+
+    nodes = list(G.nodes())
+    n_nodes = len(nodes)
+
+    if n_nodes == 0:
+        return {}
+
+    # Self loops cancel out of the Laplacian, so they do not need removing
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format="csr")
+    A = A.maximum(A.T)
+    degree = np.asarray(A.sum(axis=1)).ravel()
+
+    k2 = 1.0 / n_nodes
+    cutoff = 10 * np.sqrt(k2)
+
+    def energy_and_grad(x):
+        X = x.reshape(n_nodes, 2)
+
+        # Attraction: 0.5 * sum_ij A_ij ||x_i - x_j||^2 = tr(X^T L X), L = D - A
+        LX = degree[:, None] * X - A @ X
+        energy = np.sum(X * LX)
+        grad = 2 * LX
+
+        # Repulsion: -k^2 / 2 * log(d^2 / c^2) for each pair closer than the cutoff
+        pairs = cKDTree(X).query_pairs(cutoff, output_type="ndarray")
+        i, j = pairs[:, 0], pairs[:, 1]
+
+        diff = X[i] - X[j]
+        d2 = np.einsum("ij,ij->i", diff, diff) + 1e-9
+        energy -= 0.5 * k2 * np.sum(np.log(d2 / cutoff**2))
+
+        force = (k2 / d2)[:, None] * diff
+        for axis in range(2):
+            grad[:, axis] -= np.bincount(i, force[:, axis], n_nodes)
+            grad[:, axis] += np.bincount(j, force[:, axis], n_nodes)
+
+        return energy, grad.ravel()
+
+    x0 = np.random.default_rng(seed).random(2 * n_nodes)
+    result = minimize(
+        energy_and_grad,
+        x0,
+        method="L-BFGS-B",
+        jac=True,
+        options={"maxiter": maxiter},
+    )
+    pos = nx.rescale_layout(result.x.reshape(n_nodes, 2))
+
+    return {node: tuple(pos[i]) for i, node in enumerate(nodes)}
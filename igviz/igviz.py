@@ -1,33 +1,123 @@
-from typing import List, Tuple, Union
+from collections import OrderedDict, defaultdict
+from functools import partial
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Union
 from warnings import warn
 
 import networkx as nx
+import numpy as np
 import plotly.graph_objects as go
 from plotly import callbacks
 
+from ._spring_lbfgs import spring_lbfgs_layout
+
+# Positions computed by `PlotGraph._apply_layout`, keyed by layout and graph topology
+# so re-plotting the same graph does not rerun an expensive layout.
+_layout_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_LAYOUT_CACHE_SIZE = 32
+
+# Layouts that read the "weight" edge attribute, their cache key includes the weights
+_WEIGHTED_LAYOUTS = ("spring", "kamada")
+
+# Graphs larger than these use the Numba spring layouts when numba is installed
+_NUMBA_SPRING_THRESHOLD = 500
+_BARNES_HUT_SPRING_THRESHOLD = 1000
+
+# Graphs with more edges than this are laid out on the GPU when `use_gpu` is set
+_GPU_EDGE_THRESHOLD = 50_000
+
+# Graphs larger than these are drawn with WebGL when `renderer` is "auto"
+_GL_EDGE_THRESHOLD = 5000
+_GL_NODE_THRESHOLD = 2000
+
+
+def _random_layout(G: nx.Graph) -> dict:
+    """
+    Positions nodes uniformly at random in the unit square, like `nx.random_layout`
+    but drawing every position with a single NumPy call.
+    """
+
+    nodes = list(G.nodes())
+    pos = np.random.rand(len(nodes), 2).astype(np.float32)
+
+    return dict(zip(nodes, pos))
+
+
+def _spring_layout(G: nx.Graph, backend: Optional[str] = None) -> dict:
+    """
+    Fruchterman-Reingold layout.
+
+    Without a `backend`, graphs with more than 1000 nodes use the Barnes-Hut
+    implementation and graphs with more than 500 nodes the exact Numba implementation
+    when numba is installed, smaller graphs use NetworkX.
+    """
+
+    if backend is None:
+        if G.number_of_nodes() > _BARNES_HUT_SPRING_THRESHOLD:
+            backend = "barnes_hut"
+        elif G.number_of_nodes() > _NUMBA_SPRING_THRESHOLD:
+            backend = "numba"
+        else:
+            backend = "networkx"
+
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            backend = "networkx"
+
+    if backend == "barnes_hut":
+        from ._fr_barnes_hut import spring_layout as barnes_hut_spring_layout
+
+        return barnes_hut_spring_layout(G)
+    elif backend == "numba":
+        from ._fr_numba import spring_layout as numba_spring_layout
+
+        return numba_spring_layout(G)
+    elif backend == "networkx":
+        return nx.spring_layout(G)
+    else:
+        raise ValueError(
+            f"Unknown layout backend: {backend}. "
+            "Expected one of 'networkx', 'numba' or 'barnes_hut'."
+        )
+
+
+def invalidate_layout_cache() -> None:
+    """
+    Clears the cached node positions of previously applied layouts.
+
+    Layouts are recomputed when nodes or edges change, and for "spring" and "kamada"
+    when edge weights change. Use this to force a layout to be recomputed for a graph
+    that was already plotted, e.g. after changing other attributes the layout reads.
+    """
+
+    _layout_cache.clear()
+
 
 def plot(
-    G,
+    G: nx.Graph,
     title: str = "Graph",
-    layout: str = None,
-    size_method: str = "degree",
-    color_method: str = "degree",
-    node_label: str = None,
+    layout: Optional[str] = None,
+    size_method: Union[str, list] = "degree",
+    color_method: Union[str, list] = "degree",
+    node_label: Optional[str] = None,
     node_label_position: str = "bottom center",
-    node_text: List[str] = None,
-    edge_label: str = None,
+    node_text: Optional[List[str]] = None,
+    edge_label: Optional[str] = None,
     edge_label_position: str = "middle center",
-    edge_text: List[str] = None,
+    edge_text: Optional[List[str]] = None,
     titlefont_size: int = 16,
     showlegend: bool = False,
-    annotation_text: str = None,
+    annotation_text: Optional[str] = None,
     colorscale: str = "YlGnBu",
-    colorbar_title: str = None,
+    colorbar_title: Optional[str] = None,
     node_opacity: float = 0.8,
     arrow_size: int = 2,
     transparent_background: bool = True,
     highlight_neighbours_on_hover: bool = True,
-):
+    use_gpu: bool = False,
+    layout_backend: Optional[str] = None,
+    renderer: str = "auto",
+) -> go.FigureWidget:
     """
     Plots a Graph using Plotly.
 
@@ -39,7 +129,7 @@ def plot(
     title : str, optional
         Title of the graph, by default "Graph"
 
-    layout : {"random", "circular", "kamada", "planar", "spring", "spectral", "spiral"}, optional
+    layout : {"random", "circular", "kamada", "planar", "spring", "spring_lbfgs", "spectral", "spiral", "forceatlas2"}, optional
         Layout of the nodes on the plot.
 
             random (default): Position nodes uniformly at random in the unit square.
@@ -52,11 +142,19 @@ def plot(
             planar: Position nodes without edge intersections, if possible (if the Graph is planar).
 
             spring: Position nodes using Fruchterman-Reingold force-directed algorithm.
+                Graphs with more than 500 nodes use a faster Numba implementation if numba is installed,
+                see `layout_backend`.
+
+            spring_lbfgs: Position nodes by minimising a spring energy with SciPy's L-BFGS-B.
+                Converges faster than spring on large graphs, requires scipy.
 
             spectral: Position nodes using the eigenvectors of the graph Laplacian.
 
             spiral: Position nodes in a spiral layout.
 
+            forceatlas2: Position nodes using the ForceAtlas2 force-directed algorithm.
+                Requires networkx>=3.4, or cugraph for large graphs with `use_gpu`.
+
     size_method : {'degree', 'static'}, node property or a list, optional
         How to size the nodes., by default "degree"
 
@@ -130,6 +228,34 @@ def plot(
     highlight_neighbours_on_hover : bool, optional
         True to highlight the neighbours of a node on hover, by default True
 
+    use_gpu : bool, optional
+        True to compute "spring" and "forceatlas2" layouts of graphs with more than 50,000 edges
+        on the GPU with cuGraph's ForceAtlas2, if cugraph is installed, by default False
+
+    layout_backend : {'networkx', 'numba', 'barnes_hut'}, optional
+        Implementation of the "spring" layout, by default None
+
+            None (default): 'barnes_hut' for graphs with more than 1000 nodes, 'numba' for more than 500 nodes
+                and 'networkx' otherwise. Always 'networkx' if numba is not installed.
+
+            networkx: `nx.spring_layout`.
+
+            numba: Numba Fruchterman-Reingold with exact O(N^2) repulsion, requires numba.
+
+            barnes_hut: Numba Fruchterman-Reingold with O(N log N) Barnes-Hut approximated repulsion, requires numba.
+
+    renderer : {'auto', 'svg', 'gl', 'datashader'}, optional
+        How the traces are drawn in the browser, by default "auto"
+
+            auto (default): 'gl' for graphs with more than 5000 edges or more than 2000 nodes, 'svg' otherwise.
+
+            svg: SVG scatter traces.
+
+            gl: WebGL scatter traces, which stay responsive with far more points than SVG.
+
+            datashader: Rasterize the edges into a background image with Datashader and draw the nodes with WebGL.
+                For graphs with too many edges to draw as lines, requires datashader and pandas.
+
     Returns
     -------
     Plotly Figure
@@ -142,7 +268,7 @@ def plot(
         stacklevel=2,
     )
 
-    plot = PlotGraph(G, layout)
+    plot = PlotGraph(G, layout, use_gpu=use_gpu, layout_backend=layout_backend)
 
     node_trace = plot.generate_node_traces(
         colorscale=colorscale,
@@ -153,14 +279,18 @@ def plot(
         node_label_position=node_label_position,
         node_opacity=node_opacity,
         size_method=size_method,
+        renderer=renderer,
     )
 
     edge_trace, middle_node_trace = plot.generate_edge_traces(
         edge_label=edge_label,
         edge_label_position=edge_label_position,
         edge_text=edge_text,
+        renderer=renderer,
     )
 
+    edge_image = plot.generate_edge_image() if renderer == "datashader" else None
+
     return plot.generate_figure(
         node_trace,
         edge_trace,
@@ -172,16 +302,26 @@ def plot(
         arrow_size=arrow_size,
         transparent_background=transparent_background,
         highlight_neighbours_on_hover=highlight_neighbours_on_hover,
+        edge_image=edge_image,
+        renderer=renderer,
     )
 
 
 class PlotGraph:
-    def __init__(self, G: nx.Graph, layout: str):
+    def __init__(
+        self,
+        G: nx.Graph,
+        layout: Optional[str],
+        use_gpu: bool = False,
+        layout_backend: Optional[str] = None,
+    ) -> None:
         """
         PlotGraph is a class that plots a graph.
         """
         self.G: nx.Graph = G
         self.layout = layout
+        self.use_gpu = use_gpu
+        self.layout_backend = layout_backend
 
         if layout:
             self.pos_dict = self._apply_layout(G, layout)
@@ -190,85 +330,134 @@ class PlotGraph:
         else:
             self.pos_dict = nx.get_node_attributes(G, "pos")
 
-        self.inverse_pos_dict = {(v[0], v[1]): k for k, v in self.pos_dict.items()}
+        # The nodes in trace order, their index in the traces, and their positions as
+        # an (N, 2) array shared by the node and edge traces. Positions are sent to the
+        # browser as float32, halving the payload compared to float64 without a
+        # visible difference on the plot. With plotly>=6 the arrays are also sent as
+        # base64 encoded typed arrays instead of JSON lists.
+        self.nodes: List[Any] = list(G.nodes())
+        self.node_index: Dict[Any, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.pos: np.ndarray = np.asarray(
+            [self.pos_dict[node] for node in self.nodes], dtype=np.float32
+        ).reshape(len(self.nodes), 2)
+        self._degree_array: Optional[np.ndarray] = None
+        self._edge_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
 
     def generate_node_traces(
         self,
         colorscale: str,
-        colorbar_title: str,
-        color_method: Union[str, List[str]],
-        node_label: str,
-        node_text: List[str],
+        colorbar_title: Optional[str],
+        color_method: Union[str, list],
+        node_label: Optional[str],
+        node_text: Optional[List[str]],
         node_label_position: str,
         node_opacity: float,
-        size_method: Union[str, List[str]],
-    ):
+        size_method: Union[str, list],
+        renderer: str = "auto",
+    ) -> Union[go.Scatter, go.Scattergl]:
         node_mode = "markers+text" if node_label else "markers"
-        node_trace = go.Scatter(
-            x=[],
-            y=[],
+
+        # The hover text has the same shape for every node, so the template is built
+        # once and each node is filled in with a single str.format call.
+        node_text = node_text or []
+        template = "part: {}" + "".join(
+            "<br>" + str(prop).replace("{", "{{").replace("}", "}}") + ": {}"
+            for prop in node_text
+        )
+
+        return self._scatter_type(renderer)(
+            x=self.pos[:, 0],
+            y=self.pos[:, 1],
             mode=node_mode,
-            text=[],
-            hovertext=[],
+            text=(
+                [self.G.nodes[node][node_label] for node in self.nodes]
+                if node_label
+                else []
+            ),
+            hovertext=[
+                template.format(node, *[data[prop] for prop in node_text])
+                for node, data in self.G.nodes(data=True)
+            ],
             hoverinfo="text",
             textposition=node_label_position,
-            markersymbol="square",
+            marker_symbol="square",
             marker=dict(
                 showscale=True,
                 colorscale=colorscale,
                 reversescale=True,
-                size=[],
-                color=[],
+                size=self._node_sizes(size_method),
+                color=self._node_colors(color_method),
                 colorbar=dict(
                     thickness=15,
-                    title=colorbar_title,
+                    title=dict(text=colorbar_title, side="right"),
                     xanchor="left",
-                    titleside="right",
                 ),
                 line_width=0,
                 opacity=node_opacity,
             ),
         )
 
-        for node in self.G.nodes():
-            text = f"part: {node}"
-            x, y = self.G.nodes[node]["pos"]
-
-            node_trace["x"] += (x,)
-            node_trace["y"] += (y,)
-
-            if node_label:
-                node_trace["text"] += (self.G.nodes[node][node_label],)
-            if node_text:
-                for prop in node_text:
-                    text += f"<br>{prop}: {self.G.nodes[node][prop]}"
-            node_trace["hovertext"] += (text.strip(),)
-
-            if isinstance(size_method, list):
-                node_trace["marker"]["size"] = size_method
-            elif size_method == "degree":
-                node_trace["marker"]["size"] += (self.G.degree(node) + 12,)
-            elif size_method == "static":
-                node_trace["marker"]["size"] += (28,)
-            else:
-                node_trace["marker"]["size"] += (self.G.nodes[node][size_method],)
-
-            if isinstance(color_method, list):
-                node_trace["marker"]["color"] = color_method
-            elif color_method == "degree":
-                node_trace["marker"]["color"] += (self.G.degree(node),)
-            else:
-                node_trace["marker"]["color"] += (
-                    (self.G.nodes[node][color_method],)
-                    if color_method in self.G.nodes[node]
-                    else (color_method,)
-                )
+    def _degrees(self) -> np.ndarray:
+        """
+        Degrees of the nodes in trace order as float32, computed on first use and
+        shared by the sizes and colors.
+        """
+
+        degrees = self._degree_array
 
-        return node_trace
+        if degrees is None:
+            degrees = np.fromiter(
+                (d for _, d in self.G.degree()),
+                dtype=np.float32,
+                count=len(self.nodes),
+            )
+            self._degree_array = degrees
+
+        return degrees
+
+    def _node_sizes(self, size_method: Union[str, list]) -> Union[list, np.ndarray]:
+        """
+        Resolves `size_method` once into the marker sizes of all nodes.
+        """
+
+        if isinstance(size_method, list):
+            return size_method
+        elif size_method == "degree":
+            return self._degrees() + 12
+        elif size_method == "static":
+            return np.full(len(self.nodes), 28, dtype=np.float32)
+        else:
+            return np.fromiter(
+                (data[size_method] for _, data in self.G.nodes(data=True)),
+                dtype=np.float32,
+                count=len(self.nodes),
+            )
+
+    def _node_colors(self, color_method: Union[str, list]) -> Union[list, np.ndarray]:
+        """
+        Resolves `color_method` once into the marker colors of all nodes.
+        """
+
+        if isinstance(color_method, list):
+            return color_method
+        elif color_method == "degree":
+            return self._degrees()
+        elif not any(color_method in data for _, data in self.G.nodes(data=True)):
+            return [color_method] * len(self.nodes)
+        else:
+            # Nodes without the property fall back to `color_method` itself
+            return [
+                data.get(color_method, color_method)
+                for _, data in self.G.nodes(data=True)
+            ]
 
     def generate_edge_traces(
-        self, edge_label: str, edge_label_position: str, edge_text: List[str]
-    ) -> Tuple[go.Scatter, go.Scatter]:
+        self,
+        edge_label: Optional[str],
+        edge_label_position: str,
+        edge_text: Optional[List[str]],
+        renderer: str = "auto",
+    ) -> Tuple[Union[go.Scatter, go.Scattergl], Union[go.Scatter, go.Scattergl]]:
         """
         Generates the edge traces for the graph.
 
@@ -287,6 +476,10 @@ class PlotGraph:
         edge_text : list, optional
             A list of edge properties to display when hovering over the edge.
 
+        renderer : {'auto', 'svg', 'gl', 'datashader'}, optional
+            Draw the traces with SVG or WebGL, by default "auto". With 'datashader' the edge
+            lines are left out of the trace, see `generate_edge_image`.
+
         Returns
         -------
         Tuple[go.Scatter, go.Scatter]
@@ -294,14 +487,48 @@ class PlotGraph:
         """
 
         edge_mode = "lines+text" if edge_label else "lines"
-        edge_text_list = []
-        edge_properties = {}
+        edge_text_list: List[str] = []
+        edge_properties: DefaultDict[tuple, DefaultDict[str, list]] = defaultdict(
+            lambda: defaultdict(list)
+        )
 
-        # This trace is for the actual lines that appear on the plot
-        edge_trace = go.Scatter(
-            x=[],
-            y=[],
+        edges, xs, ys = self._edge_coordinates()
+
+        middle_xs: Union[list, np.ndarray] = []
+        middle_ys: Union[list, np.ndarray] = []
+
+        if edge_text or edge_label:
+            # One invisible node in the middle of each distinct (u, v) pair, in the
+            # order the pairs are first seen so they line up with edge_properties.
+            _, first = np.unique(edges, return_index=True)
+            first.sort()
+            middle_xs = (0.5 * (xs[0::3] + xs[1::3]))[first]
+            middle_ys = (0.5 * (ys[0::3] + ys[1::3]))[first]
+
+        edge_labels: list = []
+
+        for edge in self.G.edges(data=True):
+            if edge_text:
+                for prop in edge_text:
+                    edge_properties[edge[0], edge[1]][prop].append(edge[2][prop])
+
+            if edge_label:
+                edge_labels.append(edge[2][edge_label])
+
+        if edge_text:
+            edge_text_list = [
+                "<br>".join(f"{k}: {v}" for k, v in vals.items())
+                for _, vals in edge_properties.items()
+            ]
+
+        # This trace is for the actual lines that appear on the plot. With datashader
+        # the edges are drawn as an image by `generate_edge_image` instead.
+        scatter = self._scatter_type(renderer)
+        edge_trace = scatter(
+            x=[] if renderer == "datashader" else xs,
+            y=[] if renderer == "datashader" else ys,
             line=dict(width=1, color="#888"),
+            connectgaps=False,
             text=[],
             hoverinfo="text",
             mode=edge_mode,
@@ -309,65 +536,136 @@ class PlotGraph:
 
         # NOTE: This is a hack because Plotly does not allow you to have hover text on a line
         # Were adding an invisible node to the edges that will display the edge properties
-        middle_node_trace = go.Scatter(
-            x=[],
-            y=[],
-            text=[],
-            mode="markers",
+        middle_node_trace = scatter(
+            x=middle_xs,
+            y=middle_ys,
+            text=edge_labels,
+            hovertext=edge_text_list or None,
+            mode="markers+text" if edge_label else "markers",
             hoverinfo="text",
             textposition=edge_label_position,
             marker=dict(opacity=0),
             hoverlabel=dict(bgcolor="white")
         )
 
-        for edge in self.G.edges(data=True):
-            x0, y0 = self.G.nodes[edge[0]]["pos"]
-            x1, y1 = self.G.nodes[edge[1]]["pos"]
-            edge_trace["x"] += (x0, x1, None)
-            edge_trace["y"] += (y0, y1, None)
-
-            if edge_text or edge_label:
-                edge_pair = edge[0], edge[1]
-                if edge_pair not in edge_properties:
-                    edge_properties[edge_pair] = {}
-                    middle_node_trace["x"] += ((x0 + x1) / 2,)
-                    middle_node_trace["y"] += ((y0 + y1) / 2,)
+        return edge_trace, middle_node_trace
 
-            if edge_text:
-                for prop in edge_text:
-                    if edge[2][prop] not in edge_properties[edge_pair]:
-                        edge_properties[edge_pair][prop] = []
-                    edge_properties[edge_pair][prop].append(edge[2][prop])
+    def _edge_coordinates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Builds the node index pairs of the edges and the x and y coordinates of their
+        lines, computed on first use and shared by the edge traces and image.
 
-            if edge_label:
-                middle_node_trace["text"] += (edge[2][edge_label],)
-                middle_node_trace["mode"] = "markers+text"
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Edge index pairs with fields "a" and "b", and the x and y coordinates.
+        """
 
-        if edge_text:
-            edge_text_list = [
-                "<br>".join(f"{k}: {v}" for k, v in vals.items())
-                for _, vals in edge_properties.items()
-            ]
+        if self._edge_arrays is not None:
+            return self._edge_arrays
+
+        # Build the edge lines in one go, each segment is separated by a NaN gap
+        # so the whole trace is validated by Plotly once instead of once per edge.
+        # NaN rather than None keeps the arrays float32 instead of object dtype,
+        # which WebGL traces upload as a contiguous Float32Array.
+        pos = self.pos
+        node_index = self.node_index
+        edges = np.fromiter(
+            ((node_index[u], node_index[v]) for u, v in self.G.edges()),
+            dtype=[("a", int), ("b", int)],
+            count=self.G.number_of_edges(),
+        )
 
-            middle_node_trace["hovertext"] = edge_text_list
+        n_edges = len(edges)
+        xs = np.empty(3 * n_edges, dtype=np.float32)
+        ys = np.empty(3 * n_edges, dtype=np.float32)
+        xs[0::3] = pos[edges["a"], 0]
+        xs[1::3] = pos[edges["b"], 0]
+        xs[2::3] = np.nan
+        ys[0::3] = pos[edges["a"], 1]
+        ys[1::3] = pos[edges["b"], 1]
+        ys[2::3] = np.nan
+        self._edge_arrays = (edges, xs, ys)
 
-        return edge_trace, middle_node_trace
+        return self._edge_arrays
+
+    def generate_edge_image(self, width: int = 1024, height: int = 1024) -> dict:
+        """
+        Rasterizes the edges with Datashader into an image that sits under the traces.
+
+        Parameters
+        ----------
+        width : int, optional
+            Width of the image in pixels, by default 1024
+
+        height : int, optional
+            Height of the image in pixels, by default 1024
+
+        Returns
+        -------
+        dict
+            Plotly layout image of the edges.
+        """
+
+        try:
+            import datashader as ds
+            import datashader.transfer_functions as tf
+            import pandas as pd
+            import PIL  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "renderer='datashader' requires datashader, pandas and pillow "
+                "to be installed."
+            ) from e
+
+        _, xs, ys = self._edge_coordinates()
+
+        # Pad empty or degenerate extents so the canvas always has a non zero size
+        x_min, y_min = self.pos.min(axis=0) if len(self.nodes) else (0.0, 0.0)
+        x_max, y_max = self.pos.max(axis=0) if len(self.nodes) else (1.0, 1.0)
+        x_pad = 0.5 * (x_max - x_min) / width or 0.5
+        y_pad = 0.5 * (y_max - y_min) / height or 0.5
+        x_range = (float(x_min - x_pad), float(x_max + x_pad))
+        y_range = (float(y_min - y_pad), float(y_max + y_pad))
+
+        canvas = ds.Canvas(
+            plot_width=width, plot_height=height, x_range=x_range, y_range=y_range
+        )
+        agg = canvas.line(pd.DataFrame({"x": xs, "y": ys}), "x", "y", agg=ds.count())
+        img = tf.shade(agg, cmap=["#cccccc", "#444444"], how="log").to_pil()
+
+        return dict(
+            source=img,
+            xref="x",
+            yref="y",
+            x=x_range[0],
+            y=y_range[1],
+            sizex=x_range[1] - x_range[0],
+            sizey=y_range[1] - y_range[0],
+            sizing="stretch",
+            layer="below",
+        )
 
     def generate_figure(
         self,
-        node_trace: go.Scatter,
-        edge_trace: go.Scatter,
-        middle_node_trace: go.Scatter,
+        node_trace: Union[go.Scatter, go.Scattergl],
+        edge_trace: Union[go.Scatter, go.Scattergl],
+        middle_node_trace: Union[go.Scatter, go.Scattergl],
         title: str,
         titlefont_size: int,
         showlegend: bool,
-        annotation_text,
+        annotation_text: Optional[str],
         arrow_size: int,
         transparent_background: bool,
         highlight_neighbours_on_hover: bool,
-    ):
+        edge_image: Optional[dict] = None,
+        renderer: str = "auto",
+    ) -> go.FigureWidget:
         """
         Helper function to generate the figure for the Graph.
+
+        Arrows of directed graphs are one layout annotation per edge, which Plotly
+        builds slowly, so they are only drawn with the SVG renderer.
         """
 
         if not annotation_text:
@@ -384,35 +682,44 @@ class PlotGraph:
             )
         ]
 
-#         if isinstance(self.G, (nx.DiGraph, nx.MultiDiGraph)):
-#             annotations.extend(
-#                 dict(
-#                     ax=self.G.nodes[edge[0]]["pos"][0],
-#                     ay=self.G.nodes[edge[0]]["pos"][1],
-#                     axref="x",
-#                     ayref="y",
-#                     x=self.G.nodes[edge[1]]["pos"][0] * 0.85
-#                     + self.G.nodes[edge[0]]["pos"][0] * 0.15,
-#                     y=self.G.nodes[edge[1]]["pos"][1] * 0.85
-#                     + self.G.nodes[edge[0]]["pos"][1] * 0.15,
-#                     xref="x",
-#                     yref="y",
-#                     showarrow=True,
-#                     arrowhead=1,
-#                     arrowsize=arrow_size,
-#                 )
-#                 for edge in self.G.edges()
-#             )
+        directed = isinstance(self.G, (nx.DiGraph, nx.MultiDiGraph))
+
+        if directed and self._scatter_type(renderer) is not go.Scatter:
+            warn(
+                "Arrows of directed graphs are only drawn with the 'svg' renderer.",
+                UserWarning,
+                stacklevel=3,
+            )
+        elif directed:
+            pos = self.pos_dict
+            annotations.extend(
+                [
+                    {
+                        "ax": pos[u][0],
+                        "ay": pos[u][1],
+                        "axref": "x",
+                        "ayref": "y",
+                        "x": pos[v][0] * 0.85 + pos[u][0] * 0.15,
+                        "y": pos[v][1] * 0.85 + pos[u][1] * 0.15,
+                        "xref": "x",
+                        "yref": "y",
+                        "showarrow": True,
+                        "arrowhead": 1,
+                        "arrowsize": arrow_size,
+                    }
+                    for u, v in self.G.edges()
+                ]
+            )
 
         self.f = go.FigureWidget(
             data=[edge_trace, node_trace, middle_node_trace],
             layout=go.Layout(
-                title=title,
-                titlefont_size=titlefont_size,
+                title=dict(text=title, font_size=titlefont_size),
                 showlegend=showlegend,
                 hovermode="closest",
                 margin=dict(b=20, l=5, r=5, t=40),
                 annotations=annotations,
+                images=[edge_image] if edge_image else None,
                 xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
                 yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
             ),
@@ -431,22 +738,98 @@ class PlotGraph:
 
         return self.f
 
-    def _apply_layout(self, G, layout):
+    def _scatter_type(self, renderer: str) -> type:
+        """
+        Returns the Plotly trace type to draw the graph with.
+        """
+
+        if renderer == "auto":
+            large = (
+                self.G.number_of_edges() > _GL_EDGE_THRESHOLD
+                or self.G.number_of_nodes() > _GL_NODE_THRESHOLD
+            )
+            renderer = "gl" if large else "svg"
+
+        if renderer in ("gl", "datashader"):
+            return go.Scattergl
+        elif renderer == "svg":
+            return go.Scatter
+        else:
+            raise ValueError(
+                f"Unknown renderer: {renderer}. "
+                "Expected one of 'auto', 'svg', 'gl' or 'datashader'."
+            )
+
+    def _apply_layout(self, G: nx.Graph, layout: str) -> dict:
         """
         Applies a layout to a Graph.
         """
 
         layout_functions = {
-            "random": nx.random_layout,
+            "random": _random_layout,
             "circular": nx.circular_layout,
             "kamada": nx.kamada_kawai_layout,
             "planar": nx.planar_layout,
-            "spring": nx.spring_layout,
+            "spring": partial(_spring_layout, backend=self.layout_backend),
+            "spring_lbfgs": spring_lbfgs_layout,
             "spectral": nx.spectral_layout,
             "spiral": nx.spiral_layout,
         }
 
-        pos_dict = layout_functions[layout](G)
+        # Only available in newer versions of NetworkX
+        if hasattr(nx, "forceatlas2_layout"):
+            layout_functions["forceatlas2"] = nx.forceatlas2_layout
+
+        edges = G.edges(data="weight") if layout in _WEIGHTED_LAYOUTS else G.edges()
+        key = (
+            layout,
+            self.use_gpu,
+            self.layout_backend,
+            id(G),
+            G.number_of_nodes(),
+            G.number_of_edges(),
+            hash((frozenset(G.nodes()), frozenset(edges))),
+        )
+
+        if key in _layout_cache:
+            _layout_cache.move_to_end(key)
+            pos_dict = _layout_cache[key]
+        else:
+            if (
+                self.use_gpu
+                and layout in ("spring", "forceatlas2")
+                and G.number_of_edges() > _GPU_EDGE_THRESHOLD
+            ):
+                try:
+                    from ._cugraph import force_atlas2_layout
+                except ImportError:
+                    warn(
+                        "cugraph is not installed, computing the layout on the CPU.",
+                        UserWarning,
+                        stacklevel=4,
+                    )
+                else:
+                    layout_functions[layout] = force_atlas2_layout
+
+            if layout == "forceatlas2" and layout not in layout_functions:
+                raise ValueError(
+                    "The 'forceatlas2' layout requires networkx>=3.4, "
+                    f"networkx {nx.__version__} is installed."
+                )
+            elif layout not in layout_functions:
+                raise ValueError(
+                    f"Unknown layout: {layout}. "
+                    f"Expected one of {', '.join(map(repr, layout_functions))}."
+                )
+
+            pos_dict = layout_functions[layout](G)
+
+            # Random positions are drawn again on every plot
+            if layout != "random":
+                _layout_cache[key] = pos_dict
+
+                if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+                    _layout_cache.popitem(last=False)
 
         nx.set_node_attributes(G, pos_dict, "pos")
 
@@ -474,11 +857,13 @@ class PlotGraph:
         if not points.point_inds:
             return
 
-        node = self.inverse_pos_dict[(points.xs[0], points.ys[0])]
+        # Looking the node up by its coordinates would not survive the float32
+        # rounding of the positions, so map the point index back to the node.
+        node = self.nodes[points.point_inds[0]]
 
         # to add : parameter to hover ancestors only, descendents only or both or direct neighbours
         upper_neighbours = list(nx.ancestors(self.G, node))
-        upper_neighbours = list(nx.ancestors(nx.dfs_tree(self.G, node).reverse(), node))
+        lower_neighbours = list(nx.ancestors(nx.dfs_tree(self.G, node).reverse(), node))
         direct_neighbours = list(self.G.neighbors(node))
         
         neighbours = list(set(upper_neighbours + lower_neighbours))
@@ -490,7 +875,7 @@ class PlotGraph:
         new_colors[points.point_inds[0]] = node_colours[points.point_inds[0]]
 
         for neighbour in neighbours:
-            trace_position = list(self.pos_dict).index(neighbour)
+            trace_position = self.node_index[neighbour]
             new_colors[trace_position] = node_colours[trace_position]
 
         with self.f.batch_update():
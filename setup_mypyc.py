@@ -0,0 +1,39 @@
+"""
+Builds a wheel of igviz with `igviz.py` compiled to a C extension by mypyc.
+
+The wheel built by Poetry is pure Python. This script builds a separate platform
+specific wheel from the same pyproject.toml metadata:
+
+    pip install mypy setuptools wheel poetry-core
+    python setup_mypyc.py bdist_wheel
+    pip install dist/igviz-*.whl
+"""
+
+from pathlib import Path
+
+from mypyc.build import mypycify
+from poetry.core.factory import Factory
+from setuptools import setup
+
+# Modules compiled to C extensions, the numba and optional backends stay Python
+_COMPILED_MODULES = ["igviz/igviz.py"]
+
+package = Factory().create_poetry(Path(__file__).parent).package
+
+setup(
+    name=package.name,
+    version=package.version.text,
+    description=package.description,
+    author=package.author_name,
+    license=package.license.id if package.license else None,
+    python_requires=package.python_versions,
+    packages=["igviz"],
+    install_requires=[
+        dep.to_pep_508() for dep in package.requires if not dep.is_optional()
+    ],
+    extras_require={
+        str(extra): [dep.base_pep_508_name for dep in deps]
+        for extra, deps in package.extras.items()
+    },
+    ext_modules=mypycify(_COMPILED_MODULES),
+)
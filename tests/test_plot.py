@@ -1,4 +1,8 @@
+import json
+
 import networkx as nx
+import numpy as np
+import plotly
 import pytest
 
 import igviz as ig
@@ -73,5 +77,208 @@ def test_digraph(DG):
     ig.plot(DG)
 
 
+def test_digraph_arrows(DG):
+    fig = ig.plot(DG)
+
+    assert len(fig.layout.annotations) == DG.number_of_edges() + 1
+
+
+def test_digraph_arrows_gl():
+    DG = nx.gnm_random_graph(100, 300, seed=0, directed=True)
+
+    with pytest.warns(UserWarning, match="svg"):
+        fig = ig.plot(DG, renderer="gl")
+
+    assert len(fig.layout.annotations) == 1
+
+
 def test_multigraph(MG):
     ig.plot(MG)
+
+
+def test_edge_trace_segments(G):
+    fig = ig.plot(G)
+
+    assert len(fig.data[0].x) == 3 * G.number_of_edges()
+    assert len(fig.data[0].y) == 3 * G.number_of_edges()
+
+
+def test_multigraph_edge_text(MG):
+    fig = ig.plot(MG, edge_text=["weight"])
+
+    assert fig.data[2].hovertext == ("weight: [0.5, 0.75]", "weight: [0.5]")
+    assert len(fig.data[2].x) == 2
+
+
+def test_layout_cache(G):
+    first = ig.plot(G, layout="spring")
+    second = ig.plot(G, layout="spring")
+
+    assert list(first.data[1].x) == list(second.data[1].x)
+
+    ig.invalidate_layout_cache()
+    third = ig.plot(G, layout="spring")
+
+    assert list(first.data[1].x) != list(third.data[1].x)
+
+
+def test_layout_cache_isolated_nodes():
+    G = nx.path_graph(4)
+    G.add_node("x")
+    ig.plot(G, layout="circular")
+
+    G.remove_node("x")
+    G.add_node("y")
+    fig = ig.plot(G, layout="circular")
+
+    assert len(fig.data[1].x) == G.number_of_nodes()
+
+
+def test_layout_cache_weights(G):
+    first = ig.plot(G, layout="kamada")
+
+    nx.set_edge_attributes(
+        G, {edge: i + 1 for i, edge in enumerate(G.edges())}, "weight"
+    )
+    second = ig.plot(G, layout="kamada")
+
+    assert list(first.data[1].x) != list(second.data[1].x)
+
+
+def test_random_layout_not_cached(G):
+    first = ig.plot(G, layout="random")
+    second = ig.plot(G, layout="random")
+
+    assert list(first.data[1].x) != list(second.data[1].x)
+
+
+def test_numba_spring_layout():
+    pytest.importorskip("numba")
+    from igviz._fr_numba import spring_layout
+
+    G = nx.random_geometric_graph(600, 0.05, seed=0)
+    pos = spring_layout(G, seed=0)
+
+    assert set(pos) == set(G.nodes())
+    assert all(-1 <= c <= 1 for xy in pos.values() for c in xy)
+
+
+def test_spring_lbfgs_layout(G):
+    ig.plot(G, layout="spring_lbfgs")
+
+
+@pytest.mark.parametrize(
+    "G",
+    [nx.random_geometric_graph(50, 0.125, seed=seed) for seed in range(3)]
+    + [nx.disjoint_union(nx.grid_2d_graph(10, 10), nx.grid_2d_graph(10, 10))],
+)
+def test_spring_lbfgs_layout_disconnected(G):
+    from igviz._spring_lbfgs import spring_lbfgs_layout
+
+    pos = spring_lbfgs_layout(G, seed=0)
+    xy = np.array([pos[node] for node in G.nodes()])
+    index = {node: i for i, node in enumerate(G.nodes())}
+    u, v = np.array([(index[u], index[v]) for u, v in G.edges()]).T
+
+    # Components must not collapse to a single point when rescaled
+    assert len(np.unique(xy.round(6), axis=0)) == G.number_of_nodes()
+
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, len(xy), (2, 1000))
+    edge_length = np.linalg.norm(xy[u] - xy[v], axis=1).mean()
+    pair_distance = np.linalg.norm(xy[a] - xy[b], axis=1).mean()
+
+    assert edge_length < pair_distance
+
+
+def test_barnes_hut_spring_layout(G):
+    pytest.importorskip("numba")
+
+    ig.plot(G, layout="spring", layout_backend="barnes_hut")
+
+
+def test_unknown_layout_backend(G):
+    with pytest.raises(ValueError):
+        ig.plot(G, layout="spring", layout_backend="unknown")
+
+
+def test_forceatlas2_requires_networkx(G):
+    if hasattr(nx, "forceatlas2_layout"):
+        pytest.skip("networkx provides forceatlas2_layout")
+
+    with pytest.raises(ValueError, match="networkx>=3.4"):
+        ig.plot(G, layout="forceatlas2")
+
+    with pytest.raises(ValueError, match="networkx>=3.4"):
+        ig.plot(G, layout="forceatlas2", use_gpu=True)
+
+
+def test_unknown_layout(G):
+    with pytest.raises(ValueError):
+        ig.plot(G, layout="unknown")
+
+
+def test_use_gpu_without_cugraph(G, monkeypatch):
+    try:
+        import cugraph  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("cugraph is installed")
+
+    monkeypatch.setattr("igviz.igviz._GPU_EDGE_THRESHOLD", 0)
+
+    with pytest.warns(UserWarning, match="cugraph") as record:
+        ig.plot(G, layout="spring", use_gpu=True)
+
+    (warning,) = [w for w in record if "cugraph" in str(w.message)]
+    assert warning.filename == __file__
+
+
+def test_float32_traces(G):
+    fig = ig.plot(G)
+
+    assert fig.data[0].x.dtype == np.float32
+    assert fig.data[1].x.dtype == np.float32
+    assert fig.data[1].marker.size.dtype == np.float32
+
+
+def test_binary_trace_data(G):
+    if int(plotly.__version__.split(".")[0]) < 6:
+        pytest.skip("plotly<6 sends trace data as JSON lists")
+
+    edge_trace, node_trace, _ = json.loads(ig.plot(G).to_json())["data"]
+
+    assert edge_trace["x"]["dtype"] == "f4" and "bdata" in edge_trace["x"]
+    assert node_trace["x"]["dtype"] == "f4" and "bdata" in node_trace["x"]
+    assert node_trace["marker"]["size"]["dtype"] == "f4"
+
+
+def test_plot_gl_renderer(G):
+    fig = ig.plot(G, node_label="prop", edge_label="edge_prop", renderer="gl")
+
+    assert all(trace.type == "scattergl" for trace in fig.data)
+
+
+def test_node_hovertext(G):
+    nx.set_node_attributes(G, "a", "{name}")
+    fig = ig.plot(G, node_text=["prop", "{name}"])
+
+    assert fig.data[1].hovertext[0] == "part: 0<br>prop: 3<br>{name}: a"
+
+
+def test_edge_trace_gaps(G):
+    fig = ig.plot(G)
+
+    assert np.isnan(fig.data[0].x[2::3]).all()
+    assert fig.data[0].connectgaps is False
+
+
+def test_plot_datashader_renderer(G):
+    pytest.importorskip("datashader")
+    pytest.importorskip("PIL")
+
+    fig = ig.plot(G, renderer="datashader")
+
+    assert len(fig.data[0].x) == 0
+    assert len(fig.layout.images) == 1